@@ -4,6 +4,7 @@ import sys
 
 import cv2
 
+from capture import FrameGrabber
 from consumer import (
     BaseConsumer,
     HttpConsumer,
@@ -24,28 +25,53 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
 
     # --- Consumer args ---
-    parser.add_argument(
+    consumer_args = parser.add_argument_group("consumer options")
+    consumer_args.add_argument(
         "--consumer",
         choices=["stdout", "http"],
         default="stdout",
         help="Select output consumer (default: stdout)",
     )
-    parser.add_argument("--url", help="URL for http consumer")
-    parser.add_argument(
+    consumer_args.add_argument("--url", help="URL for http consumer")
+    consumer_args.add_argument(
         "--preview-mode",
         choices=["full", "landmarks"],
         help="Enabled OpenCV preview mode",
     )
 
-    # --- HandEngine args (optional, only if HandEngine wants to parse CLI) ---
-    parser.add_argument(
+    # --- HandEngine args ---
+    engine_args = parser.add_argument_group("hand engine options")
+    engine_args.add_argument(
         "--frame-skip", type=int, default=1, help="Process every Nth frame"
     )
-    parser.add_argument(
+    engine_args.add_argument(
         "--buffer-size", type=int, default=5, help="Number of frames to buffer"
     )
+    engine_args.add_argument(
+        "--inference-width",
+        type=int,
+        default=320,
+        help="Downscale frames to this width before detection, 0 disables "
+        "(default: 320)",
+    )
+    engine_args.add_argument(
+        "--model-complexity",
+        type=int,
+        choices=[0, 1],
+        default=1,
+        help="Hand landmark model: 0 (lite, faster) or 1 (full) (default: 1)",
+    )
+    engine_args.add_argument(
+        "--static-threshold",
+        type=int,
+        default=8,
+        help="Reuse the last detection while frames change by less than this "
+        "gray level, 0 disables (default: 8)",
+    )
 
     args = parser.parse_args()
+    if args.consumer == "http" and not args.url:
+        parser.error("--url is required when using --consumer http")
     return args
 
 
@@ -80,22 +106,32 @@ def main():
         - --preview-mode: display live camera feed (full camera or landmarks-only mode)
         - --frame-skip: number of frames to skip between processing
         - --buffer-size: number of frames to buffer for detection smoothing
+        - --inference-width: width frames are downscaled to before detection
+        - --model-complexity: MediaPipe hand landmark model (0 lite, 1 full)
+        - --static-threshold: frame change below which detection is reused
 
     Example usage:
         python main.py --consumer stdout --preview-mode full --gesture-buffer 5
 
     Raises:
-        SystemExit: if required resources (camera, config, etc.) are unavailable.
+        SystemExit: if required resources (camera, config, etc.) are unavailable,
+            or with status 1 if hand detection fails.
     """
-    cap = cv2.VideoCapture(0)
     args = parse_args()
+    grabber = FrameGrabber(0)
     hand_engine = HandEngine(
         frame_skip=args.frame_skip,
         buffer_size=args.buffer_size,
+        model_complexity=args.model_complexity,
+        input_width=args.inference_width,
+        static_threshold=args.static_threshold,
         consumers=get_consumers(args),
     )
+    hand_engine.warmup()
 
+    preview = args.preview_mode is not None
     running = True
+    exit_code = 0
 
     # Signal handler to stop gracefully
     def stop_gracefully(signum, _):
@@ -106,28 +142,40 @@ def main():
             # stdout/stderr already closed, just continue shutdown
             pass
         running = False
+        grabber.stop()
 
     signal.signal(signal.SIGINT, stop_gracefully)
     signal.signal(signal.SIGTERM, stop_gracefully)
 
+    grabber.start()
+
     try:
-        while cap.isOpened() and running:
-            ret, frame = cap.read()
-            if not ret:
+        while running:
+            frame = grabber.read()
+            if frame is None:
                 break
 
-            # Mirror frame for more natural video output.
-            mirrored_frame = cv2.flip(frame, 1)
-            hand_engine.process_frame(mirrored_frame)
+            hand_engine.process_frame(frame)
+
+            # Refresh the preview window once per frame; 'q' quits.
+            if preview and cv2.waitKey(1) & 0xFF == ord("q"):
+                running = False
 
     except BrokenPipeError:
         # Handle case where the stdout pipe is closed early
         running = False
 
+    except RuntimeError as e:
+        # Background hand detection failed, report why before exiting.
+        cause = f": {e.__cause__!r}" if e.__cause__ else ""
+        print(f"{e}{cause}", file=sys.stderr)
+        exit_code = 1
+
     finally:
-        cap.release()
+        grabber.release()
+        hand_engine.close()
         cv2.destroyAllWindows()
-        sys.exit(0)
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
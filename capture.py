@@ -0,0 +1,99 @@
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+
+class FrameGrabber:
+    """
+    Reads camera frames on a background thread so capture overlaps processing.
+
+    Frames are pushed into a small bounded queue. When the queue is full the
+    oldest frame is dropped, so the consumer always works on recent frames and
+    a slow processing loop never stalls the camera.
+
+    Args:
+        source (int | str): Camera index or video file path (default: 0).
+        queue_size (int): Maximum number of frames buffered (default: 2).
+        width (int): Requested camera frame width (default: 640).
+        height (int): Requested camera frame height (default: 480).
+        fps (int): Requested camera frame rate (default: 30).
+
+    Notes:
+        - Cameras are asked for MJPG frames and a single-frame driver buffer,
+          so frames are fresh and USB bandwidth allows the requested rate.
+          Drivers may ignore any of these settings.
+
+    Attributes:
+        cap (cv2.VideoCapture): Underlying OpenCV capture.
+        stopped (threading.Event): Set once capture ends or `release` is called.
+            The capture thread releases `cap` when it exits.
+    """
+
+    def __init__(self, source=0, queue_size=2, width=640, height=480, fps=30):
+        self.cap = cv2.VideoCapture(source)
+        if isinstance(source, int):
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.q: queue.Queue[np.ndarray] = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "FrameGrabber":
+        """Start the capture thread."""
+        self.thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self.stopped.is_set() and self.cap.isOpened():
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+
+            try:
+                self.q.put(frame, block=False)
+            except queue.Full:
+                # Drop the oldest frame to make room for the newest one.
+                try:
+                    self.q.get_nowait()
+                except queue.Empty:
+                    pass
+                self.q.put_nowait(frame)
+
+        self.stopped.set()
+        # Released here, never while a read may still be in progress.
+        self.cap.release()
+
+    def read(self, timeout: float = 0.1) -> np.ndarray | None:
+        """
+        Return the next buffered frame, blocking until one is available.
+
+        Returns:
+            np.ndarray | None: A BGR frame, or None once capture has stopped
+            and no frames are left in the queue.
+        """
+        while True:
+            try:
+                return self.q.get(timeout=timeout)
+            except queue.Empty:
+                if self.stopped.is_set():
+                    return None
+
+    def stop(self) -> None:
+        """Signal the capture thread to stop."""
+        self.stopped.set()
+
+    def release(self) -> None:
+        """
+        Stop the capture thread and release the camera. If the thread is
+        still blocked in a read, it releases the camera once the read returns.
+        """
+        self.stop()
+        if self.thread.ident is None:
+            self.cap.release()
+        else:
+            self.thread.join(timeout=1.0)
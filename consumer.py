@@ -1,12 +1,15 @@
-import json
+import queue
+import sys
+import threading
 from enum import Enum
 
 import cv2
 import numpy as np
 import requests
-from mediapipe.python.solutions import drawing_utils as mp_draw
+from requests.adapters import HTTPAdapter
 from mediapipe.python.solutions.hands import HAND_CONNECTIONS
 
+from detector import FINGER_STATES
 from event import HandEvent
 
 
@@ -21,25 +24,66 @@ class BaseConsumer:
     def consume(self, _: HandEvent):
         raise NotImplementedError
 
+    def close(self) -> None:
+        """Release any resources held by the consumer."""
+
 
 class StdoutConsumer(BaseConsumer):
     """Default consumer that prints finger states as JSON to stdout."""
 
     def consume(self, event: HandEvent) -> None:
-        print(json.dumps(event.to_dict()), flush=True)
+        # Single flush per event, readers of the pipe expect each
+        # event as soon as it is emitted.
+        out = sys.stdout.buffer
+        out.write(event.json)
+        out.write(b"\n")
+        out.flush()
 
 
 class HttpConsumer(BaseConsumer):
-    """HTTP consumer that POST finger states as JSON to the set URL."""
+    """
+    HTTP consumer that POST finger states as JSON to the set URL.
+
+    Requests are sent from a background worker so a slow server never blocks
+    frame processing. Events are dropped while the outgoing queue is full.
+    """
+
+    _QUEUE_SIZE = 16
 
     def __init__(self, url: str):
         self.url = url
+        # Reuse one keep-alive connection instead of reconnecting per event.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+
+        self.q: queue.Queue[bytes | None] = queue.Queue(maxsize=self._QUEUE_SIZE)
+        self.worker = threading.Thread(target=self._drain, daemon=True)
+        self.worker.start()
 
     def consume(self, event: HandEvent) -> None:
         try:
-            requests.post(self.url, json=event.to_dict(), timeout=0.5)
-        except requests.RequestException as e:
-            print(f"Failed to send event: {e}")
+            self.q.put_nowait(event.json)
+        except queue.Full:
+            pass
+
+    def close(self) -> None:
+        try:
+            # None is the sentinel that stops the worker.
+            self.q.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self.worker.join(timeout=1.0)
+        self.session.close()
+
+    def _drain(self) -> None:
+        while (payload := self.q.get()) is not None:
+            try:
+                self.session.post(self.url, data=payload, timeout=0.5)
+            except requests.RequestException as e:
+                print(f"Failed to send event: {e}")
 
 
 class PreviewMode(Enum):
@@ -55,9 +99,43 @@ class PreviewMode(Enum):
     LANDMARKS = "landmarks"
 
 
+GESTURE_MAP: dict[tuple[int, int, int, int, int], str] = {
+    (0, 1, 0, 0, 0): "Pointing (Index)",
+    (0, 1, 1, 0, 0): "Victory Sign",
+    (0, 1, 1, 1, 0): "Three-Finger Salute",
+    (0, 1, 0, 0, 1): "Horns",
+    (1, 1, 0, 0, 1): "I love you",
+    (0, 0, 1, 0, 0): "Rude!!!",
+    (0, 0, 0, 0, 0): "Fist",
+    (1, 0, 0, 0, 0): "Thumbs Up",
+    (1, 1, 1, 1, 1): "Open Palm",
+    (1, 0, 0, 0, 1): "Shaka Sign",
+}
+
+# Landmark id pairs of the hand skeleton segments, shape (K, 2).
+_CONNECTIONS = np.array(sorted(HAND_CONNECTIONS), dtype=np.intp)
+
+# Gesture names indexed by fingers code, defaulting to the raised finger count.
+_GESTURE_NAMES: tuple[str, ...] = tuple(
+    GESTURE_MAP.get(fingers, f"{sum(fingers)} fingers") for fingers in FINGER_STATES
+)
+
+
+def classify_gesture(fingers_code: int) -> str:
+    """
+    Map a 5-bit fingers code (see FINGER_STATES) to a gesture name.
+    Extend GESTURE_MAP for more gestures.
+    """
+    return _GESTURE_NAMES[fingers_code]
+
+
 class OpenCVWindowConsumer(BaseConsumer):
     """Consumer that displays hand landmarks and finger states in a window."""
 
+    # Same look as MediaPipe's default drawing specs.
+    _LANDMARK_COLOR = (0, 0, 255)
+    _CONNECTION_COLOR = (224, 224, 224)
+
     def __init__(self, window_name="Gesture Detector", mode=PreviewMode.FULL):
         self.window_name = window_name
         self.mode = mode
@@ -79,35 +157,30 @@ class OpenCVWindowConsumer(BaseConsumer):
             self._draw_text(frame, "No hands detected", center=True)
         else:
             for i, hand in enumerate(event.hands):
-                if hand.landmarks:
-                    mp_draw.draw_landmarks(frame, hand.landmarks, HAND_CONNECTIONS)
+                if hand.landmarks is not None:
+                    self._draw_landmarks(frame, hand.landmarks)
 
-                stable_gesture = self.classify_gesture(hand.stable_fingers)
-                text = f"{hand.label}: {stable_gesture} - Gesture: {hand.gesture}"
+                stable_gesture = classify_gesture(hand.fingers_code)
+                label = hand.label.name.capitalize()
+                text = f"{label}: {stable_gesture} - Gesture: {hand.gesture}"
 
                 self._draw_text(frame, text, (10, 50 + i * 40))
 
+        # Window events are pumped once per frame by the main loop (cv2.waitKey).
         cv2.imshow(self.window_name, frame)
-        cv2.waitKey(1)
 
-    def classify_gesture(self, fingers):
+    def _draw_landmarks(self, frame, landmarks: np.ndarray) -> None:
         """
-        Map finger states to gesture name.
-        Extend this dictionary for more gestures.
+        Draw the hand skeleton from a (21, 2) normalized landmarks array:
+        one polylines call for all segments, then a dot per landmark.
         """
-        gesture_map = {
-            (0, 1, 0, 0, 0): "Pointing (Index)",
-            (0, 1, 1, 0, 0): "Victory Sign",
-            (0, 1, 1, 1, 0): "Three-Finger Salute",
-            (0, 1, 0, 0, 1): "Horns",
-            (1, 1, 0, 0, 1): "I love you",
-            (0, 0, 1, 0, 0): "Rude!!!",
-            (0, 0, 0, 0, 0): "Fist",
-            (1, 0, 0, 0, 0): "Thumbs Up",
-            (1, 1, 1, 1, 1): "Open Palm",
-            (1, 0, 0, 0, 1): "Shaka Sign",
-        }
-        return gesture_map.get(tuple(fingers), f"{sum(fingers)} fingers")
+        h, w, _ = frame.shape
+        points = (landmarks * (w, h)).astype(np.int32)
+
+        segments = list(points[_CONNECTIONS])
+        cv2.polylines(frame, segments, False, self._CONNECTION_COLOR, 2)
+        for x, y in points.tolist():
+            cv2.circle(frame, (x, y), 2, self._LANDMARK_COLOR, 2)
 
     def _draw_text(
         self,
@@ -132,12 +205,10 @@ class OpenCVWindowConsumer(BaseConsumer):
             thickness (int): Text thickness.
         """
         font = cv2.FONT_HERSHEY_SIMPLEX
-        h, w, _ = frame.shape
-
-        text_size, _ = cv2.getTextSize(text, font, scale, thickness)
-        text_w, text_h = text_size
 
         if center:
+            h, w, _ = frame.shape
+            (text_w, text_h), _ = cv2.getTextSize(text, font, scale, thickness)
             x = (w - text_w) // 2
             y = (h + text_h) // 2
         else:
@@ -1,7 +1,47 @@
-from collections import deque
 from dataclasses import dataclass
 
-from tracker import HandLabel
+from hand_label import HandLabel
+
+# Fingers codes decoded to [thumb, index, middle, ring, pinky] tuples.
+FINGER_STATES: tuple[tuple[int, int, int, int, int], ...] = tuple(
+    tuple((code >> i) & 1 for i in range(5)) for code in range(32)
+)
+
+
+def _compile_fingers_up(hand_label: HandLabel):
+    """
+    Generate the finger states function for one hand, with the finger checks
+    unrolled over constant landmark ids and the thumb direction inlined.
+
+    The generated function takes a (21, 2) landmarks array and returns a 5-bit
+    code, bit i set when finger i is up (thumb = bit 0).
+    """
+    # Thumb (x-axis check), mirrored between right and left hand.
+    thumb_op = "<" if hand_label == HandLabel.RIGHT else ">"
+    lines = [
+        "def fingers_up(landmarks):",
+        "    x, y = landmarks.T.tolist()",
+        f"    code = 1 if x[4] {thumb_op} x[3] else 0",
+    ]
+
+    # Other 4 fingers (y-axis check): both position of tip vs joints (pip, mcp)
+    # and relative distance to the wrist.
+    for bit, tip in enumerate((8, 12, 16, 20), start=1):
+        lines += [
+            f"    if y[{tip}] < y[{tip - 2}] < y[{tip - 3}]"
+            f" and abs(y[{tip}] - y[0]) > 0.1:",
+            f"        code |= {1 << bit}",
+        ]
+    lines.append("    return code")
+
+    namespace = {}
+    filename = f"<fingers_up_{hand_label.name.lower()}>"
+    exec(compile("\n".join(lines), filename, "exec"), namespace)
+    return namespace["fingers_up"]
+
+
+# Generated finger states functions, indexed by HandLabel.
+_FINGERS_UP = tuple(_compile_fingers_up(hand_label) for hand_label in HandLabel)
 
 
 @dataclass(frozen=True)
@@ -58,60 +98,36 @@ class FingersDetector:
         buffer_size=5,
     ):
         self.buffer_size = buffer_size
-        self.history: dict[HandLabel, deque] = {
-            "Left": deque(maxlen=buffer_size),
-            "Right": deque(maxlen=buffer_size),
-        }
-
-    def process_hand(self, landmarks, hand_label) -> tuple[int, int, int, int, int]:
+        # Last buffer_size fingers codes per hand, packed 5 bits each into an
+        # int with the newest in the lowest bits, and how many slots are filled.
+        self.history: list[int] = [0 for _ in HandLabel]
+        self.filled: list[int] = [0 for _ in HandLabel]
+        self._history_mask = (1 << (5 * buffer_size)) - 1
+        self._oldest_shift = 5 * (buffer_size - 1)
+        # Running tally of the fingers codes currently in each history buffer.
+        self.counts: list[list[int]] = [[0] * len(FINGER_STATES) for _ in HandLabel]
+
+    def process_hand(self, landmarks, hand_label: HandLabel) -> int:
         """
-        Process a single hand and return stable fingers positions.
+        Process a single hand and return stable fingers positions,
+        as a 5-bit code decodable through FINGER_STATES.
         """
 
-        fingers = self.fingers_up(landmarks, hand_label)
-        self.history[hand_label].append(fingers)
+        code = _FINGERS_UP[hand_label](landmarks)
+        history = self.history[hand_label]
+        counts = self.counts[hand_label]
 
-        # Compute stable fingers (most frequent in history)
-        stable_fingers = max(
-            set(self.history[hand_label]),
-            key=self.history[hand_label].count,
-        )
-        return stable_fingers
+        # Keep the tally in sync with the code about to be shifted out.
+        if self.filled[hand_label] == self.buffer_size:
+            counts[history >> self._oldest_shift] -= 1
+        else:
+            self.filled[hand_label] += 1
 
-    def fingers_up(self, landmarks, hand_label) -> tuple[int, int, int, int, int]:
-        """
-        Determine which fingers are up.
-        Returns list: [thumb, index, middle, ring, pinky]
-        """
+        self.history[hand_label] = ((history << 5) | code) & self._history_mask
+        counts[code] += 1
 
-        fingers = []
-        landmark = landmarks.landmark
-
-        # Thumb (x-axis check)
-        if hand_label == "Right":
-            fingers.append(
-                1 if landmark[self.THUMB_TIP].x < landmark[self.THUMB_PIP].x else 0
-            )
-        else:  # Left hand
-            fingers.append(
-                1 if landmark[self.THUMB_TIP].x > landmark[self.THUMB_PIP].x else 0
-            )
-
-        # Other 4 fingers (y-axis check)
-        tip_ids = [self.INDEX_TIP, self.MIDDLE_TIP, self.RING_TIP, self.PINKY_TIP]
-        for tip_id in tip_ids:
-            tip = landmark[tip_id]
-            pip = landmark[tip_id - 2]
-            mcp = landmark[tip_id - 3]
-            wrist = landmark[0]
-
-            # Check both position of tip vs joint and relative distance to the writst.
-            if tip.y < pip.y and pip.y < mcp.y and abs(tip.y - wrist.y) > 0.1:
-                fingers.append(1)
-            else:
-                fingers.append(0)
-
-        return tuple(fingers)
+        # Compute stable fingers (most frequent in history)
+        return counts.index(max(counts))
 
     def resolve_pointer(self, landmarks, fingers) -> Pointer | None:
         """
@@ -132,28 +148,21 @@ class FingersDetector:
             (4, self.PINKY_TIP),
         ]
 
-        extended = [landmarks.landmark[idx] for i, idx in tips_map if fingers[i] == 1]
+        extended = [idx for i, idx in tips_map if fingers[i] == 1]
 
         # No fingers → wrist
         if not extended:
-            wrist = landmarks.landmark[self.WRIST]
-            return Pointer(wrist.x, wrist.y)
-
-        # One finger → direct pointer
-        if len(extended) == 1:
-            tip = extended[0]
-            return Pointer(tip.x, tip.y)
+            extended = [self.WRIST]
 
         # Open hand → ignore thumb if all fingers extended
-        if sum(fingers) >= 4 and fingers[0] == 1:
+        elif sum(fingers) >= 4 and fingers[0] == 1:
             extended = [
-                landmarks.landmark[idx]
+                idx
                 for i, idx in tips_map
                 if i != 0 and fingers[i] == 1  # exclude thumb
             ]
 
-        # Centroid of extended fingers
-        x = sum(p.x for p in extended) / len(extended)
-        y = sum(p.y for p in extended) / len(extended)
+        # Centroid of extended fingers (or the single fingertip / wrist)
+        x, y = landmarks[extended].mean(axis=0).tolist()
 
         return Pointer(x, y)
@@ -1,25 +1,55 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
+import orjson
 
-from detector import Pointer
+from detector import FINGER_STATES, Pointer
+from hand_label import HandLabel
 from motion import Motion
-from tracker import HandLabel
 
+# Serialized names of each HandLabel.
+_LABEL_NAMES = ("left", "right")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False)
 class HandState:
+    """
+    State of a single hand in a frame.
+
+    Equality and hashing only consider label, stable fingers and gesture:
+    pointer and motion are continuous, and comparing landmark arrays would
+    be both costly and ambiguous.
+    """
+
     label: HandLabel
-    stable_fingers: tuple[int, int, int, int, int]
+    fingers_code: int  # 5-bit stable finger states, see FINGER_STATES
     pointer: Pointer | None
     gesture: str | None
     motion: Motion | None
-    landmarks: object | None = None
+    landmarks: np.ndarray | None = None  # (21, 2) normalized coordinates
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HandState):
+            return NotImplemented
+        return (
+            self.label == other.label
+            and self.fingers_code == other.fingers_code
+            and self.gesture == other.gesture
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.label, self.fingers_code, self.gesture))
+
+    @property
+    def stable_fingers(self) -> tuple[int, int, int, int, int]:
+        """Stable finger states: [thumb, index, middle, ring, pinky]."""
+        return FINGER_STATES[self.fingers_code]
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary."""
         return {
-            "label": self.label.lower(),
+            "label": _LABEL_NAMES[self.label],
             "fingers": self.stable_fingers,
             "pointer": self.pointer.to_dict() if self.pointer else None,
             "gesture": self.gesture,
@@ -42,3 +72,8 @@ class HandEvent:
         return {
             "hands": [hand.to_dict() for hand in self.hands],
         }
+
+    @cached_property
+    def json(self) -> bytes:
+        """JSON encoding of `to_dict`, computed once and shared by all consumers."""
+        return orjson.dumps(self.to_dict())
@@ -1,18 +1,13 @@
-from dataclasses import dataclass
-
+import cv2
+import numpy as np
 from interpreter import GestureEngine
 
 from consumer import BaseConsumer
-from detector import FingersDetector
+from detector import FINGER_STATES, FingersDetector
 from event import HandEvent, HandState
+from hand_label import HandLabel
 from motion import MotionEstimator
-from tracker import HandLabel, HandTracker
-
-
-@dataclass(frozen=True)
-class Hand:
-    stable_fingers: tuple[int, int, int, int, int]
-    gesture: str | None
+from tracker import HandTracker
 
 
 class HandEngine:
@@ -34,50 +29,70 @@ class HandEngine:
         frame_skip: int = 1,
         consumers: list[BaseConsumer] | None = None,
         gesture_engine: GestureEngine | None = None,
+        model_complexity: int = 1,
+        input_width: int | None = 320,
+        static_threshold: int = 8,
     ):
         self.buffer_size = buffer_size
         self.frame_skip = frame_skip
-        self.hand_tracker = HandTracker()
+        self.hand_tracker = HandTracker(
+            input_width=input_width,
+            model_complexity=model_complexity,
+            static_threshold=static_threshold,
+        )
         self.fingers_detector = FingersDetector(buffer_size=buffer_size)
         self.gesture_engine = gesture_engine or GestureEngine()
         self.motion_estimator = MotionEstimator(buffer_size=self._MOTION_BUFFER_SIZE)
         self.consumers = consumers or []
+        # Only always_consume consumers (e.g. previews) render the frame.
+        self.needs_frame = any(c.always_consume for c in self.consumers)
+        # Reused across frames to avoid allocating a new mirrored image each time.
+        self._mirrored: np.ndarray | None = None
         self.frame_mod = 0
-        self.last_hand: dict[HandLabel, Hand | None] = {
-            "Left": None,
-            "Right": None,
-        }
+        # Last (fingers_code, gesture) reported per hand, None when not tracked.
+        self.last_hand: list[tuple[int, str | None] | None] = [None for _ in HandLabel]
+        # Hands from the last processed frame, redrawn on skipped frames.
+        self.last_hands: list[HandState] = []
 
     def process_frame(self, frame):
         """
-        Process a video frame: detect hands, analyze fingers & gestures,
-        and notify consumers with the results.
+        Process a raw (not mirrored) video frame: detect hands, analyze
+        fingers & gestures, and notify consumers with the results.
+
+        Hand detection runs on a background thread, so results may lag the
+        frame passed in by a frame or two; the call itself never waits on it.
+
+        Raises:
+            RuntimeError: If background hand detection has failed.
         """
 
         self.frame_mod = (self.frame_mod + 1) % self.frame_skip
-        if self.frame_mod != 0:
+        if self.frame_mod == 0:
+            self.hand_tracker.submit(frame)
+
+        # Detection runs in the background; until a new result is ready, only
+        # refresh consumers that render every frame.
+        hands_data = self.hand_tracker.poll()
+        if hands_data is None:
+            self._refresh(frame)
             return
 
-        hands_data = self.hand_tracker.detect(frame)
-
         any_change = False
         any_gesture = False
 
-        hand_event = HandEvent(
-            hands=[],
-            frame=frame,
-        )
+        hands: list[HandState] = []
 
         for landmarks, hand_label in hands_data:
-            stable_fingers = self.fingers_detector.process_hand(landmarks, hand_label)
+            fingers_code = self.fingers_detector.process_hand(landmarks, hand_label)
+            stable_fingers = FINGER_STATES[fingers_code]
             pointer = self.fingers_detector.resolve_pointer(landmarks, stable_fingers)
             motion = self.motion_estimator.update(hand_label, pointer)
             gesture = self.gesture_engine.process(motion, hand_label)
 
-            hand_event.hands.append(
+            hands.append(
                 HandState(
                     label=hand_label,
-                    stable_fingers=stable_fingers,
+                    fingers_code=fingers_code,
                     pointer=pointer,
                     gesture=gesture,
                     motion=motion,
@@ -85,16 +100,65 @@ class HandEngine:
                 )
             )
 
-            hand = Hand(stable_fingers=stable_fingers, gesture=gesture)
-            if self.last_hand.get(hand_label) != hand:
+            hand = (fingers_code, gesture)
+            if self.last_hand[hand_label] != hand:
                 any_change = True
             self.last_hand[hand_label] = hand
 
             if gesture:
                 any_gesture = True
 
+        # A hand leaving the frame is also a change, and resetting its state
+        # makes the same pose be reported again when the hand comes back.
+        seen = {hand.label for hand in hands}
+        for hand_label, hand in enumerate(self.last_hand):
+            if hand is not None and hand_label not in seen:
+                self.last_hand[hand_label] = None
+                any_change = True
+
         should_emit = any_change or any_gesture
 
+        # Skip building the event when no consumer would receive it.
+        if not (should_emit or self.needs_frame):
+            return
+
+        hand_event = HandEvent(
+            hands=hands,
+            frame=self._mirror(frame) if self.needs_frame else None,
+        )
+        self.last_hands = hands
+
         for consumer in self.consumers:
             if consumer.always_consume or should_emit:
                 consumer.consume(hand_event)
+
+    def warmup(self):
+        """Warm up hand tracking so the first frame is not delayed by setup."""
+        self.hand_tracker.warmup()
+
+    def close(self):
+        """Stop background detection and close all registered consumers."""
+        self.hand_tracker.stop()
+        for consumer in self.consumers:
+            consumer.close()
+
+    def _mirror(self, frame):
+        """Mirror the frame for a more natural preview, into a reused buffer."""
+        if self._mirrored is None or self._mirrored.shape != frame.shape:
+            self._mirrored = np.empty_like(frame)
+
+        cv2.flip(frame, 1, dst=self._mirrored)
+        return self._mirrored
+
+    def _refresh(self, frame):
+        """
+        Dispatch the last detected hands with a fresh frame to consumers that
+        consume every frame (e.g. preview windows), without running inference.
+        """
+        if not self.needs_frame:
+            return
+
+        hand_event = HandEvent(hands=self.last_hands, frame=self._mirror(frame))
+        for consumer in self.consumers:
+            if consumer.always_consume:
+                consumer.consume(hand_event)
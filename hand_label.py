@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class HandLabel(IntEnum):
+    """Handedness of a hand, doubling as an index into per-hand lists."""
+
+    LEFT = 0
+    RIGHT = 1
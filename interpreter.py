@@ -2,6 +2,7 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 
+from hand_label import HandLabel
 from motion import Motion
 
 
@@ -71,7 +72,7 @@ class GestureEngine:
         self.state: dict[tuple, float] = {}  # (hand, gesture) -> last_fire_time
         self.streaks: dict[tuple, int] = {}  # (hand, gesture) -> consecutive matches
 
-    def process(self, motion: Motion | None, hand_label: str) -> str | None:
+    def process(self, motion: Motion | None, hand_label: HandLabel) -> str | None:
         if motion is None:
             return None
 
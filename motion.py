@@ -30,9 +30,10 @@ Important:
 """
 
 import math
-from collections import deque
 from dataclasses import dataclass
 
+from hand_label import HandLabel
+
 
 @dataclass
 class Motion:
@@ -78,10 +79,13 @@ class MotionEstimator:
     """
 
     def __init__(self, buffer_size=3):
-        self.history = {
-            "Left": deque(maxlen=buffer_size),
-            "Right": deque(maxlen=buffer_size),
-        }
+        self.buffer_size = buffer_size
+        # Per-hand ring buffers of pointer coordinates, sample i stored at
+        # slot i % buffer_size, plus the number of samples written so far.
+        # Indexed by HandLabel.
+        self.xs = [[0.0] * buffer_size for _ in HandLabel]
+        self.ys = [[0.0] * buffer_size for _ in HandLabel]
+        self.count = [0 for _ in HandLabel]
 
     def update(self, hand_label, pointer) -> Motion | None:
         """
@@ -94,7 +98,7 @@ class MotionEstimator:
         provided (e.g., hand configuration does not support pointing), no motion is returned.
 
         Args:
-            hand_label (str): Identifier for the hand (e.g., "Left", "Right").
+            hand_label (HandLabel): Identifier for the hand, used as a list index.
             pointer (Pointer | None): Current pointer position. Must expose `x` and `y`
                                      attributes in normalized coordinates [0,1].
 
@@ -104,21 +108,31 @@ class MotionEstimator:
         if pointer is None:
             return None
 
-        h = self.history[hand_label]
-        h.append((pointer.x, pointer.y))
-
-        if len(h) < 2:
+        # A buffer smaller than two samples can never yield a velocity.
+        n = self.buffer_size
+        if n < 2:
             return None
 
-        dxs = []
-        dys = []
+        xs = self.xs[hand_label]
+        ys = self.ys[hand_label]
+        count = self.count[hand_label]
+
+        xs[count % n] = pointer.x
+        ys[count % n] = pointer.y
+        count += 1
+        self.count[hand_label] = count
+
+        if count < 2:
+            return None
 
-        for i in range(1, len(h)):
-            dxs.append(h[i][0] - h[i - 1][0])
-            dys.append(h[i][1] - h[i - 1][1])
+        # Once full, the oldest sample sits in the slot written next.
+        newest = (count - 1) % n
+        oldest = count % n if count >= n else 0
 
-        vx = sum(dxs) / len(dxs)
-        vy = sum(dys) / len(dys)
+        # The mean of consecutive deltas telescopes to (last - first) / steps.
+        steps = min(count, n) - 1
+        vx = (xs[newest] - xs[oldest]) / steps
+        vy = (ys[newest] - ys[oldest]) / steps
         speed = math.sqrt(vx * vx + vy * vy)
 
         return Motion(vx=vx, vy=vy, speed=speed)
@@ -1,9 +1,26 @@
-from typing import Literal
+import queue
+import threading
 
 import cv2
 import mediapipe as mp
+import numpy as np
 
-HandLabel = Literal["Left", "Right"]
+from hand_label import HandLabel
+
+# MediaPipe assumes mirrored (selfie) input; on raw frames handedness is swapped.
+_MIRRORED_LABEL: dict[str, HandLabel] = {
+    "Left": HandLabel.RIGHT,
+    "Right": HandLabel.LEFT,
+}
+
+
+def _put_latest(q: queue.Queue, item) -> None:
+    """Put item on a size-1 queue, replacing any item not yet taken."""
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    q.put_nowait(item)
 
 
 class HandTracker:
@@ -14,10 +31,23 @@ class HandTracker:
         max_hands (int): Maximum number of hands to detect (default: 2).
         detection_conf (float): Minimum confidence for hand detection (default: 0.7).
         track_conf (float): Minimum confidence for hand landmark tracking (default: 0.7).
+        input_width (int | None): Width frames are downscaled to before inference,
+            preserving aspect ratio (default: 320). None disables downscaling.
+        model_complexity (int): Hand landmark model, 0 (lite) or 1 (full) (default: 1).
+        static_threshold (int): Largest gray level change, per cell of a 32x32
+            thumbnail, for which a frame counts as unchanged since the last
+            inference and the previous result is reused (default: 8). 0 disables.
+
+    Notes:
+        - Hands runs in video mode: palm detection only runs when no hands are
+          tracked, otherwise landmarks are tracked from the previous frame's
+          hand region. Frames must therefore be passed in capture order.
+        - Detection can run synchronously via `detect`, or on a background
+          thread via `submit` / `poll`. MediaPipe Hands is not thread-safe, so
+          a single tracker should not mix both once `submit` has been called.
 
     Attributes:
         hands (mp.solutions.hands.Hands): MediaPipe hands detector instance.
-        mp_draw (module): MediaPipe drawing utilities for rendering landmarks.
     """
 
     def __init__(
@@ -25,45 +55,171 @@ class HandTracker:
         max_hands=2,
         detection_conf=0.7,
         track_conf=0.7,
+        input_width: int | None = 320,
+        model_complexity=1,
+        static_threshold=8,
     ):
         self.max_hands = max_hands
+        self.input_width = input_width
         self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
             max_num_hands=max_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=detection_conf,
             min_tracking_confidence=track_conf,
         )
-        self.mp_draw = mp.solutions.drawing_utils
+        self._small: np.ndarray | None = None
+        self._rgb: np.ndarray | None = None
+
+        # Thumbnails of the current frame and of the last frame inferred on.
+        self.static_threshold = static_threshold
+        self._thumb_bgr = np.empty((32, 32, 3), dtype=np.uint8)
+        self._thumb = np.empty((32, 32), dtype=np.uint8)
+        self._ref_thumb = np.empty((32, 32), dtype=np.uint8)
+        self._last_result: list[tuple[np.ndarray, HandLabel]] | None = None
+
+        # Latest pending frame and latest unread result of the background worker.
+        self._frames: queue.Queue[np.ndarray | None] = queue.Queue(maxsize=1)
+        self._results: queue.Queue[list] = queue.Queue(maxsize=1)
+        self._worker = threading.Thread(target=self._detect_loop, daemon=True)
+        # Set when detection raised on the worker, re-raised by `poll`.
+        self._error: Exception | None = None
+
+    def warmup(self, frame_shape=(480, 640, 3)) -> None:
+        """
+        Run detection once on a black frame so MediaPipe builds its graph and
+        the input buffers are allocated before the first real frame.
+        """
+        self.detect(np.zeros(frame_shape, dtype=np.uint8))
+
+    def submit(self, frame) -> None:
+        """
+        Queue a frame for detection on the background worker, replacing any
+        frame still waiting. Results are collected with `poll`.
+        """
+        if self._worker.ident is None:
+            self._worker.start()
+        _put_latest(self._frames, frame)
+
+    def poll(self) -> list[tuple[np.ndarray, HandLabel]] | None:
+        """
+        Return the most recent background detection result not yet polled,
+        in the same format as `detect`, or None if none is ready.
+
+        Raises:
+            RuntimeError: If the background worker has stopped because
+                detection raised, chained to the original exception.
+        """
+        try:
+            return self._results.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self._error is not None:
+            raise RuntimeError("Hand detection worker failed") from self._error
+        return None
+
+    def stop(self) -> None:
+        """Stop the background worker, if started."""
+        if self._worker.ident is None:
+            return
+        _put_latest(self._frames, None)
+        self._worker.join(timeout=1.0)
+
+    def _detect_loop(self) -> None:
+        try:
+            while (frame := self._frames.get()) is not None:
+                _put_latest(self._results, self.detect(frame))
+        except Exception as e:
+            # Surface the failure on the main thread instead of dying quietly.
+            self._error = e
 
-    def detect(self, frame) -> list[tuple[object, HandLabel]]:
+    def detect(self, frame) -> list[tuple[np.ndarray, HandLabel]]:
         """
         Run hand detection on a single video frame.
 
         Args:
             frame (numpy.ndarray):
-                A BGR image (as returned by OpenCV `cv2.VideoCapture.read`).
+                A BGR image (as returned by OpenCV `cv2.VideoCapture.read`),
+                not mirrored.
 
         Returns:
-            list[tuple[mediapipe.framework.formats.landmark_pb2.NormalizedLandmarkList, str]]:
+            list[tuple[numpy.ndarray, str]]:
                 A list of detected hands. Each entry is a tuple:
-                    - landmarks: a NormalizedLandmarkList with 21 landmarks
-                      (x, y in [0,1] relative to image width/height, z relative to depth).
-                    - hand_label: "Left" or "Right" depending on handedness classification.
+                    - landmarks: a (21, 2) float32 array of landmarks indexed by id
+                      (x, y in [0,1] relative to image width/height). Depth (z)
+                      is not used downstream and is dropped.
+                    - hand_label: HandLabel.LEFT or HandLabel.RIGHT from handedness.
 
                 Returns an empty list if no hands are detected.
 
         Notes:
-            - The function internally converts the BGR frame to RGB for MediaPipe.
+            - The function internally downscales the frame to `input_width` and
+              converts it to RGB for MediaPipe, reusing the same buffers across calls.
+            - Results are expressed in the mirrored (selfie) view: x coordinates are
+              flipped and handedness swapped, so the frame itself is never flipped.
             - Coordinates are normalized and must be scaled to pixel values if needed.
             - Multiple hands may be returned in a single frame.
+            - If the frame barely differs from the last one run through MediaPipe
+              (see `static_threshold`), the previous result is returned as is.
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb)
+        if self.static_threshold and self._is_unchanged(frame):
+            return self._last_result
+
+        height, width, _ = frame.shape
+        if self.input_width and width > self.input_width:
+            small_shape = (height * self.input_width // width, self.input_width, 3)
+            if self._small is None or self._small.shape != small_shape:
+                self._small = np.empty(small_shape, dtype=np.uint8)
+
+            cv2.resize(
+                frame,
+                (small_shape[1], small_shape[0]),
+                dst=self._small,
+                interpolation=cv2.INTER_AREA,
+            )
+            frame = self._small
+
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        results = self.hands.process(self._rgb)
         hands_data = []
 
         if results.multi_hand_landmarks and results.multi_handedness:
             for landmarks, handedness in zip(
                 results.multi_hand_landmarks, results.multi_handedness
             ):
-                label = handedness.classification[0].label
+                label = _MIRRORED_LABEL[handedness.classification[0].label]
+                landmarks = self._to_array(landmarks)
+                landmarks[:, 0] = 1.0 - landmarks[:, 0]
                 hands_data.append((landmarks, label))
+
+        self._last_result = hands_data
         return hands_data
+
+    def _is_unchanged(self, frame) -> bool:
+        """
+        Compare a 32x32 grayscale thumbnail of the frame with the one of the
+        last frame inferred on. When changed, the frame becomes the reference.
+        """
+        cv2.resize(frame, (32, 32), dst=self._thumb_bgr, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._thumb_bgr, cv2.COLOR_BGR2GRAY, dst=self._thumb)
+
+        if self._last_result is not None:
+            diff = cv2.absdiff(self._thumb, self._ref_thumb)
+            if int(diff.max()) < self.static_threshold:
+                return True
+
+        self._thumb, self._ref_thumb = self._ref_thumb, self._thumb
+        return False
+
+    @staticmethod
+    def _to_array(landmarks) -> np.ndarray:
+        """Convert a NormalizedLandmarkList into a (21, 2) float32 (x, y) array."""
+        return np.fromiter(
+            (c for p in landmarks.landmark for c in (p.x, p.y)),
+            dtype=np.float32,
+            count=42,
+        ).reshape(21, 2)